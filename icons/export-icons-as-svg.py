@@ -1,8 +1,11 @@
+import multiprocessing
+import os
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
 
 from fontTools.misc.roundTools import otRound
+from fontTools.pens.recordingPen import RecordingPen
 from fontTools.pens.svgPathPen import SVGPathPen
-from fontTools.pens.transformPen import TransformPen
 from fontTools.ufoLib import UFOReader
 
 
@@ -10,6 +13,62 @@ def numToString(number):
     return str(otRound(number))
 
 
+class IconSVGPathPen(SVGPathPen):
+    """SVGPathPen that formats each command with a single f-string, instead of
+    calling numToString and joining per coordinate. Coordinates are rounded with
+    otRound, like numToString does, so the output is unchanged.
+
+    The y axis is flipped around flipY as points come in, which is cheaper than
+    wrapping the pen in a TransformPen.
+    """
+
+    def __init__(self, glyphSet, flipY):
+        super().__init__(glyphSet, numToString)
+        self._flipY = flipY
+
+    def _flipPoints(self, points):
+        flipY = self._flipY
+        return [None if pt is None else (pt[0], flipY - pt[1]) for pt in points]
+
+    def moveTo(self, pt):
+        x, y = pt
+        super().moveTo((x, self._flipY - y))
+
+    def lineTo(self, pt):
+        x, y = pt
+        super().lineTo((x, self._flipY - y))
+
+    def curveTo(self, *points):
+        super().curveTo(*self._flipPoints(points))
+
+    def qCurveTo(self, *points):
+        super().qCurveTo(*self._flipPoints(points))
+
+    def _moveTo(self, pt):
+        self._handleAnchor()
+        x, y = pt
+        self._commands.append(f"M{otRound(x)} {otRound(y)}")
+        self._lastCommand = "M"
+        self._lastX, self._lastY = pt
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        (x1, y1), (x2, y2), (x3, y3) = pt1, pt2, pt3
+        self._commands.append(
+            f"C{otRound(x1)} {otRound(y1)} {otRound(x2)} {otRound(y2)} "
+            f"{otRound(x3)} {otRound(y3)}"
+        )
+        self._lastCommand = "C"
+        self._lastX, self._lastY = pt3
+
+    def _qCurveToOne(self, pt1, pt2):
+        (x1, y1), (x2, y2) = pt1, pt2
+        self._commands.append(
+            f"Q{otRound(x1)} {otRound(y1)} {otRound(x2)} {otRound(y2)}"
+        )
+        self._lastCommand = "Q"
+        self._lastX, self._lastY = pt2
+
+
 def makeSVG(pathString, width, height):
     return (
         f'<svg xmlns="http://www.w3.org/2000/svg" '
@@ -22,20 +81,75 @@ thisDir = pathlib.Path(__file__).resolve().parent
 ufoPath = thisDir / "fontra-icons.ufo"
 imagesDir = thisDir.parent / "src" / "fontra" / "client" / "images"
 
-reader = UFOReader(ufoPath)
 
-glyphSet = reader.getGlyphSet()
+class RecordedGlyph:
+    def __init__(self, glyph):
+        self.recording = RecordingPen()
+        glyph.draw(self.recording)
+        self.width = glyph.width
+
+    def draw(self, pen):
+        self.recording.replay(pen)
+
+
+def loadGlyphs(ufoPath):
+    # Parse each .glif file exactly once, also when it is used as a component
+    glyphSet = UFOReader(ufoPath).getGlyphSet()
+    return {
+        glyphName: RecordedGlyph(glyphSet[glyphName]) for glyphName in glyphSet.keys()
+    }
 
-iconNames = sorted(
-    glyphName
-    for glyphName in glyphSet.keys()
-    if glyphName != "space" and glyphName[0] not in "._" and len(glyphName) > 1
-)
 
-for iconName in iconNames:
-    pen = SVGPathPen(glyphSet, numToString)
-    glyph = glyphSet[iconName]
-    glyph.draw(TransformPen(pen, (1, 0, 0, -1, 0, 800)))
+# Set in the parent before forking, so workers share it; where fork is not
+# available, each worker process loads its own copy
+_glyphs = None
+
+
+def _initWorker(ufoPath):
+    global _glyphs
+    _glyphs = loadGlyphs(ufoPath)
+
+
+def renderIcon(iconName):
+    pen = IconSVGPathPen(_glyphs, 800)
+    glyph = _glyphs[iconName]
+    glyph.draw(pen)
     svgPath = pen.getCommands()
     iconPath = imagesDir / f"{iconName}.svg"
-    iconPath.write_text(makeSVG(svgPath, glyph.width, 1000))
+    # The SVG data is ASCII-only
+    iconPath.write_bytes(makeSVG(svgPath, glyph.width, 1000).encode("ascii"))
+
+
+def main():
+    global _glyphs
+
+    _glyphs = loadGlyphs(ufoPath)
+
+    iconNames = sorted(
+        glyphName
+        for glyphName in _glyphs
+        if glyphName != "space" and glyphName[0] not in "._" and len(glyphName) > 1
+    )
+
+    if multiprocessing.get_start_method() == "fork":
+        # Forked workers inherit the loaded glyphs. Fork is only used where it
+        # is the platform default: it's unsafe on macOS.
+        executorArgs = {}
+    else:
+        executorArgs = dict(initializer=_initWorker, initargs=(ufoPath,))
+
+    with ProcessPoolExecutor(
+        max_workers=getNumUsableCPUs(), **executorArgs
+    ) as executor:
+        for _ in executor.map(renderIcon, iconNames, chunksize=32):
+            pass
+
+
+def getNumUsableCPUs():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+if __name__ == "__main__":
+    main()
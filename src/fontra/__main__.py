@@ -1,21 +1,64 @@
 import argparse
 import logging
-import secrets
-from importlib.metadata import entry_points
+import os
+import sys
+from functools import cache
+from importlib.metadata import EntryPoint, entry_points
 
 from . import __version__ as fontraVersion
 from .core.protocols import ProjectManager, ProjectManagerFactory
-from .core.server import FontraServer, findFreeTCPPort
+from .core.server import FontraServer
 
 DEFAULT_PORT = 8000
 
 
 def main() -> None:
+    logFormat = "%(name)-17s %(levelname)-8s %(message)s"
+    if sys.stderr.isatty():
+        # When not logging to a terminal, we're likely running as a service,
+        # and the log collector adds its own timestamps
+        logFormat = "%(asctime)s " + logFormat
     logging.basicConfig(
-        format="%(asctime)s %(name)-17s %(levelname)-8s %(message)s",
+        format=logFormat,
         level=logging.INFO,
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    # Only the project manager factory for the chosen sub-command gets loaded:
+    # parse once without sub-command arguments to find out which one it is,
+    # then parse again with the arguments of the chosen one
+    args, _ = buildArgumentParser().parse_known_args()
+    args = buildArgumentParser(args.projectManagerName).parse_args()
+
+    manager: ProjectManager = args.getProjectManager(args)
+    server = FontraServer(
+        host=args.host,
+        httpPort=args.http_port,
+        defaultHTTPPort=DEFAULT_PORT,
+        projectManager=manager,
+        launchWebBrowser=args.launch,
+        versionToken=os.urandom(4).hex(),
+    )
+    server.setup()
+    server.run()
+
+
+@cache
+def getProjectManagerEntryPoints() -> dict[str, EntryPoint]:
+    projectManagerEntryPoints: dict[str, EntryPoint] = {}
+    for entryPoint in entry_points(group="fontra.projectmanagers"):
+        # Avoid adding a sub-parser multiple times
+        # See https://github.com/googlefonts/fontra/issues/141
+        projectManagerEntryPoints.setdefault(entryPoint.name, entryPoint)
+    return projectManagerEntryPoints
+
+
+# Cached per selected project manager, so repeated main() calls in the same
+# process, from tests or a reloader, don't rebuild the parsers and reload the
+# project manager factory
+@cache
+def buildArgumentParser(
+    selectedProjectManagerName: str | None = None,
+) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", default="localhost")
     parser.add_argument(
@@ -35,31 +78,23 @@ def main() -> None:
         help="Show Fontra's version number and exit",
     )
 
-    subParsers = parser.add_subparsers(required=True)
-    for entryPoint in entry_points(group="fontra.projectmanagers"):
-        if entryPoint.name in subParsers.choices:
-            # Avoid adding a sub-parser multiple times
-            # See https://github.com/googlefonts/fontra/issues/141
+    projectManagerEntryPoints = getProjectManagerEntryPoints()
+    subParsers = parser.add_subparsers(
+        required=True,
+        dest="projectManagerName",
+        # Like argparse's default, but that would show the dest name in errors
+        metavar="{" + ",".join(projectManagerEntryPoints) + "}",
+    )
+    for name, entryPoint in projectManagerEntryPoints.items():
+        if name != selectedProjectManagerName:
+            subParsers.add_parser(name, add_help=False)
             continue
-        subParser = subParsers.add_parser(entryPoint.name)
+        subParser = subParsers.add_parser(name)
         pmFactory: ProjectManagerFactory = entryPoint.load()
         pmFactory.addArguments(subParser)
         subParser.set_defaults(getProjectManager=pmFactory.getProjectManager)
 
-    args = parser.parse_args()
-
-    host = args.host
-    httpPort = args.http_port
-    manager: ProjectManager = args.getProjectManager(args)
-    server = FontraServer(
-        host=host,
-        httpPort=httpPort if httpPort is not None else findFreeTCPPort(DEFAULT_PORT),
-        projectManager=manager,
-        launchWebBrowser=args.launch,
-        versionToken=secrets.token_hex(4),
-    )
-    server.setup()
-    server.run()
+    return parser
 
 
 if __name__ == "__main__":
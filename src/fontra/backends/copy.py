@@ -3,7 +3,7 @@ import asyncio
 import logging
 import pathlib
 import shutil
-from contextlib import aclosing, asynccontextmanager
+from contextlib import aclosing, asynccontextmanager, nullcontext
 
 from ..core.protocols import ReadableFontBackend, WritableFontBackend
 from . import getFileSystemBackend, newFileSystemBackend
@@ -28,14 +28,16 @@ async def copyFont(
     else:
         context = async_nullcontext(sourceBackend)
 
+    batchedWrites = getattr(destBackend, "batchedWrites", nullcontext)
     async with context as sourceBackend:
-        return await _copyFont(
-            sourceBackend,
-            destBackend,
-            numTasks=numTasks,
-            progressInterval=progressInterval,
-            continueOnError=continueOnError,
-        )
+        with batchedWrites():
+            return await _copyFont(
+                sourceBackend,
+                destBackend,
+                numTasks=numTasks,
+                progressInterval=progressInterval,
+                continueOnError=continueOnError,
+            )
 
 
 async def _copyFont(
@@ -6,11 +6,12 @@ import os
 import pathlib
 import shutil
 import uuid
-from collections import defaultdict
+from contextlib import contextmanager
 from copy import deepcopy
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from functools import cache, cached_property, partial, singledispatch
+from functools import cache, cached_property, lru_cache, partial, singledispatch
+from operator import attrgetter
 from os import PathLike
 from types import SimpleNamespace
 from typing import Any, Awaitable, Callable
@@ -23,9 +24,9 @@ from fontTools.designspaceLib import (
 )
 from fontTools.misc.transform import DecomposedTransform
 from fontTools.pens.pointPen import AbstractPointPen
-from fontTools.pens.recordingPen import RecordingPointPen
 from fontTools.ufoLib import UFOReaderWriter
 from fontTools.ufoLib.glifLib import GlyphSet
+from fs.errors import NoSysPath
 
 from ..core.classes import (
     Anchor,
@@ -51,7 +52,11 @@ from ..core.path import PackedPathPointPen
 from ..core.protocols import WritableFontBackend
 from ..core.subprocess import runInSubProcess
 from .filewatcher import Change, FileWatcher
-from .ufo_utils import extractGlyphNameAndCodePoints
+from .ufo_utils import (
+    extractGlyphNameAndCodePoints,
+    extractGlyphNameAndCodePointsFromPath,
+    readGlifHeader,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -127,6 +132,9 @@ class DesignspaceBackend:
         self.fileWatcherCallbacks: list[Callable[[Any], Awaitable[None]]] = []
         self._glyphDependenciesTask: asyncio.Task[GlyphDependencies] | None = None
         self._glyphDependencies: GlyphDependencies | None = None
+        # Glyph sets whose contents.plist still needs writing while inside
+        # batchedWrites(), else None: contents.plist is written right away
+        self._glyphSetsWithModifiedContents: dict[int, GlyphSet] | None = None
         self._initialize(dsDoc)
 
     def _initialize(self, dsDoc: DesignSpaceDocument) -> None:
@@ -139,7 +147,8 @@ class DesignspaceBackend:
         self.ufoManager = UFOManager()
         self.updateAxisInfo()
         self.loadUFOLayers()
-        self.buildGlyphFileNameMapping()
+        # Built on demand, only external changes need it
+        self._glifFileNames: dict[str, str] | None = None
         self.glyphMap = getGlyphMapFromGlyphSet(self.defaultDSSource.layer.glyphSet)
         self.savedGlyphModificationTimes: dict[str, set] = {}
 
@@ -167,6 +176,7 @@ class DesignspaceBackend:
         return sorted((await self.glyphDependencies).usedBy.get(glyphName, []))
 
     def _reloadDesignSpaceFromFile(self):
+        self._writeGlyphSetContents()
         self._initialize(DesignSpaceDocument.fromfile(self.dsDoc.path))
 
     def updateAxisInfo(self):
@@ -177,7 +187,9 @@ class DesignspaceBackend:
         for dsAxis in self.dsDoc.axes:
             axis, poles = unpackDSAxis(dsAxis)
             axes.append(axis)
-            axisPolePositions[dsAxis.name] = {dsAxis.map_forward(p) for p in poles}
+            axisPolePositions[dsAxis.name] = frozenset(
+                dsAxis.map_forward(p) for p in poles
+            )
             defaultLocation[dsAxis.name] = dsAxis.map_forward(dsAxis.default)
         self.axes = axes
 
@@ -192,6 +204,7 @@ class DesignspaceBackend:
         ]
 
         self.axisNames = set(defaultLocation)
+        self.axisOrder = tuple(defaultLocation)
         self.axisPolePositions = axisPolePositions
         self.defaultLocation = defaultLocation
 
@@ -249,31 +262,64 @@ class DesignspaceBackend:
                 else source.layerName
             )
             sourceName = makeUniqueSourceName(sourceName)
+            location = {**self.defaultLocation, **source.location}
 
             self.dsSources.append(
                 DSSource(
                     uuid=source.fontraUUID,
                     name=sourceName,
                     layer=sourceLayer,
-                    location={**self.defaultLocation, **source.location},
+                    location=location,
+                    locationTuple=self._locationTuple(location),
                     isDefault=source == self.dsDoc.default,
                 )
             )
 
         self._updatePathsToWatch()
 
-    def buildGlyphFileNameMapping(self):
+    @property
+    def glifFileNames(self) -> dict[str, str]:
+        if self._glifFileNames is None:
+            self._glifFileNames = self.buildGlyphFileNameMapping()
+        return self._glifFileNames
+
+    def buildGlyphFileNameMapping(self) -> dict[str, str]:
         glifFileNames = {}
         for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
             for glyphName, fileName in glyphSet.contents.items():
                 glifFileNames[fileName] = glyphName
-        self.glifFileNames = glifFileNames
-
-    def updateGlyphSetContents(self, glyphSet):
-        glyphSet.writeContents()
-        glifFileNames = self.glifFileNames
-        for glyphName, fileName in glyphSet.contents.items():
-            glifFileNames[fileName] = glyphName
+        return glifFileNames
+
+    def updateGlyphSetContents(self, glyphSet, glyphName):
+        fileName = glyphSet.contents.get(glyphName)
+        if fileName is not None and self._glifFileNames is not None:
+            self._glifFileNames[fileName] = glyphName
+        if self._glyphSetsWithModifiedContents is None:
+            glyphSet.writeContents()
+        else:
+            self._glyphSetsWithModifiedContents[id(glyphSet)] = glyphSet
+
+    @contextmanager
+    def batchedWrites(self):
+        """Within this context, write each modified contents.plist once, on
+        exit, instead of after every glyph that is written or deleted.
+        """
+        if self._glyphSetsWithModifiedContents is not None:
+            # Already batching
+            yield
+            return
+        self._glyphSetsWithModifiedContents = {}
+        try:
+            yield
+        finally:
+            self._writeGlyphSetContents()
+            self._glyphSetsWithModifiedContents = None
+
+    def _writeGlyphSetContents(self):
+        if self._glyphSetsWithModifiedContents:
+            for glyphSet in self._glyphSetsWithModifiedContents.values():
+                glyphSet.writeContents()
+            self._glyphSetsWithModifiedContents.clear()
 
     async def getGlyphMap(self) -> dict[str, list[int]]:
         return dict(self.glyphMap)
@@ -380,12 +426,11 @@ class DesignspaceBackend:
                 ufoLayerName if ufoLayerName != defaultLayerName else "<default>",
             )
 
-            sourceLocation = {**self.defaultLocation, **source["location"]}
             globalLocation = self._getGlobalPortionOfLocation(
-                sourceLocation, localAxisNames
+                source["location"], localAxisNames
             )
             dsSource = self.dsSources.findItem(
-                locationTuple=tuplifyLocation(globalLocation)
+                locationTuple=self._locationTuple(globalLocation)
             )
             assert dsSource is not None
             ufoPath = dsSource.layer.path
@@ -407,7 +452,6 @@ class DesignspaceBackend:
         assert isinstance(codePoints, list)
         assert all(isinstance(cp, int) for cp in codePoints)
         self.glyphMap[glyphName] = codePoints
-
         if self._glyphDependencies is not None:
             self._glyphDependencies.update(glyphName, componentNamesFromGlyph(glyph))
 
@@ -494,8 +538,7 @@ class DesignspaceBackend:
             )
             glyphSet.writeGlyph(glyphName, layerGlyph, drawPointsFunc=drawPointsFunc)
             if writeGlyphSetContents:
-                # FIXME: this is inefficient if we write many glyphs
-                self.updateGlyphSetContents(glyphSet)
+                self.updateGlyphSetContents(glyphSet, glyphName)
 
             modTimes.add(glyphSet.getGLIFModificationTime(glyphName))
 
@@ -509,8 +552,7 @@ class DesignspaceBackend:
         for layerName in layersToDelete:
             glyphSet = self.ufoLayers.findItem(fontraLayerName=layerName).glyphSet
             glyphSet.deleteGlyph(glyphName)
-            # FIXME: this is inefficient if we write many glyphs
-            self.updateGlyphSetContents(glyphSet)
+            self.updateGlyphSetContents(glyphSet, glyphName)
             modTimes.add(None)
 
         self.savedGlyphModificationTimes[glyphName] = modTimes
@@ -523,13 +565,12 @@ class DesignspaceBackend:
             for name, value in localDefaultLocation.items()
             if source.location.get(name, value) != value
         }
-        sourceLocation = {**self.defaultLocation, **source.location}
         globalLocation = self._getGlobalPortionOfLocation(
-            sourceLocation, localDefaultLocation
+            source.location, localDefaultLocation
         )
 
         dsSource = self.dsSources.findItem(
-            locationTuple=tuplifyLocation(globalLocation)
+            locationTuple=self._locationTuple(globalLocation)
         )
         if dsSource is None:
             dsSource = self._createDSSource(glyphName, source, globalLocation)
@@ -603,7 +644,7 @@ class DesignspaceBackend:
             # Create a new layer in the appropriate existing UFO
             atPole = {**self.defaultLocation, **atPole}
             poleDSSource = self.dsSources.findItem(
-                locationTuple=tuplifyLocation(atPole)
+                locationTuple=self._locationTuple(atPole)
             )
             if poleDSSource is None:
                 poleDSSource = self.defaultDSSource
@@ -631,6 +672,7 @@ class DesignspaceBackend:
             name=source.name,
             layer=ufoLayer,
             location=globalLocation,
+            locationTuple=self._locationTuple(globalLocation),
         )
         self.dsSources.append(dsSource)
 
@@ -670,13 +712,17 @@ class DesignspaceBackend:
         }
         return {**self.defaultLocation, **globalLocation}
 
+    def _locationTuple(self, location):
+        # The location values in axis order: cheaper than sorting the items
+        return tuple(location.get(name) for name in self.axisOrder)
+
     async def deleteGlyph(self, glyphName):
         if glyphName not in self.glyphMap:
             raise KeyError(f"Glyph '{glyphName}' does not exist")
         for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
             if glyphName in glyphSet:
                 glyphSet.deleteGlyph(glyphName)
-                glyphSet.writeContents()
+                self.updateGlyphSetContents(glyphSet, glyphName)
         del self.glyphMap[glyphName]
         self.savedGlyphModificationTimes[glyphName] = None
         if self._glyphDependencies is not None:
@@ -842,10 +888,12 @@ class DesignspaceBackend:
 
         # TODO: update glyphMap for changed non-new glyphs
 
+        glyphSet = self.defaultDSSource.layer.glyphSet
+        glyphsDir = getGlyphSetSysPath(glyphSet)
         for glyphName in changedItems.newGlyphs:
             try:
-                glifData = self.defaultDSSource.layer.glyphSet.getGLIF(glyphName)
-            except KeyError:
+                glifData = readGlifHeaderFromGlyphSet(glyphSet, glyphName, glyphsDir)
+            except (KeyError, FileNotFoundError):
                 logger.info(f"new glyph '{glyphName}' not found in default source")
                 continue
             gn, codePoints = extractGlyphNameAndCodePoints(glifData)
@@ -873,12 +921,12 @@ class DesignspaceBackend:
 
     async def _analyzeExternalChanges(self, changes) -> SimpleNamespace | None:
         if any(os.path.splitext(path)[1] == ".designspace" for _, path in changes):
-            if (
-                self.dsDoc.path
-                and self.dsDocModTime != os.stat(self.dsDoc.path).st_mtime
-            ):
+            dsDocModTime = (
+                os.stat(self.dsDoc.path).st_mtime if self.dsDoc.path else None
+            )
+            if dsDocModTime is not None and self.dsDocModTime != dsDocModTime:
                 # .designspace changed externally, reload all the things
-                self.dsDocModTime = os.stat(self.dsDoc.path).st_mtime
+                self.dsDocModTime = dsDocModTime
                 return None
             # else:
             #     print("it was our own change, not an external one")
@@ -910,6 +958,8 @@ class DesignspaceBackend:
             # TODO: come up with a better solution.
             #
             await asyncio.sleep(0.15)
+            # Make sure our own pending contents changes don't get lost
+            self._writeGlyphSetContents()
             for glyphSet in self.ufoLayers.iterAttrs("glyphSet"):
                 glyphSet.rebuildContents()
 
@@ -934,8 +984,7 @@ class DesignspaceBackend:
             # New glyph
             changedItems.rebuildGlyphSetContents = True
             if glyphName is None:
-                with open(path, "rb") as f:
-                    glyphName, _ = extractGlyphNameAndCodePoints(f.read())
+                glyphName, _ = extractGlyphNameAndCodePointsFromPath(path)
                 self.glifFileNames[fileName] = glyphName
                 changedItems.newGlyphs.add(glyphName)
                 return
@@ -946,15 +995,16 @@ class DesignspaceBackend:
         if glyphName is None:
             return
 
-        if os.path.exists(path):
+        try:
             mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        else:
             # Round-trip through datetime, as that's effectively what is happening
             # in getGLIFModificationTime, deep down in the fs package. It makes sure
             # we're comparing timestamps that are actually comparable, as they're
             # rounded somewhat, compared to the raw st_mtime timestamp.
             mtime = datetime.fromtimestamp(mtime).timestamp()
-        else:
-            mtime = None
         savedMTimes = self.savedGlyphModificationTimes.get(glyphName, ())
         if savedMTimes is not None and mtime not in savedMTimes:
             logger.info(f"external change '{glyphName}'")
@@ -1126,12 +1176,9 @@ class DSSource:
     name: str
     layer: UFOLayer
     location: dict[str, float]
+    locationTuple: tuple
     isDefault: bool = False
 
-    @cached_property
-    def locationTuple(self):
-        return tuplifyLocation(self.location)
-
     def newFontraSource(self, localDefaultOverride=None):
         if localDefaultOverride is None:
             localDefaultOverride = {}
@@ -1175,7 +1222,10 @@ class ItemList:
 
     def append(self, item):
         self.items.append(item)
-        self.invalidateCache()
+        # Update the existing mappings, instead of rebuilding them on next use
+        for attrTuple, keyMapping in self._mappings.items():
+            itemValueTuple = _makeItemValueGetter(attrTuple)(item)
+            keyMapping.setdefault(itemValueTuple, []).append(item)
 
     def invalidateCache(self):
         self._mappings = {}
@@ -1189,13 +1239,11 @@ class ItemList:
         valueTuple = tuple(kwargs.values())
         keyMapping = self._mappings.get(attrTuple)
         if keyMapping is None:
-            keyMapping = defaultdict(list)
+            keyMapping = {}
+            getItemValueTuple = _makeItemValueGetter(attrTuple)
             for item in self.items:
-                itemValueTuple = tuple(
-                    getattr(item, attrName) for attrName in attrTuple
-                )
-                keyMapping[itemValueTuple].append(item)
-            self._mappings[attrTuple] = dict(keyMapping)
+                keyMapping.setdefault(getItemValueTuple(item), []).append(item)
+            self._mappings[attrTuple] = keyMapping
         return keyMapping.get(valueTuple)
 
     def iterAttrs(self, attrName):
@@ -1203,6 +1251,15 @@ class ItemList:
             yield getattr(item, attrName)
 
 
+@cache
+def _makeItemValueGetter(attrTuple):
+    getter = attrgetter(*attrTuple)
+    if len(attrTuple) == 1:
+        # attrgetter() with a single attribute returns the bare value
+        return lambda item: (getter(item),)
+    return getter
+
+
 def ufoLayerToStaticGlyph(glyphSet, glyphName, penClass=PackedPathPointPen):
     glyph = UFOGlyph()
     glyph.lib = {}
@@ -1269,15 +1326,20 @@ def readGlyphOrCreate(
     return layerGlyph
 
 
+# DecomposedTransform only has float fields, so there's no need for the
+# recursive copying that dataclasses.asdict() does
+_decomposedTransformFieldNames = tuple(f.name for f in fields(DecomposedTransform))
+_identityDecomposedTransform = DecomposedTransform()
+
+
 def populateUFOLayerGlyph(
     layerGlyph: UFOGlyph,
     staticGlyph: StaticGlyph,
     forceVariableComponents: bool = False,
 ) -> Callable[[AbstractPointPen], None]:
-    pen = RecordingPointPen()
     layerGlyph.width = staticGlyph.xAdvance
     layerGlyph.height = staticGlyph.yAdvance
-    staticGlyph.path.drawPoints(pen)
+    regularComponents = []
     variableComponents = []
     layerGlyph.anchors = [
         {"name": a.name, "x": a.x, "y": a.y} for a in staticGlyph.anchors
@@ -1290,62 +1352,106 @@ def populateUFOLayerGlyph(
         if component.location or forceVariableComponents:
             # Store as a variable component
             varCoDict = {"base": component.name, "location": component.location}
-            if component.transformation != DecomposedTransform():
-                varCoDict["transformation"] = asdict(component.transformation)
+            if component.transformation != _identityDecomposedTransform:
+                varCoDict["transformation"] = {
+                    fieldName: getattr(component.transformation, fieldName)
+                    for fieldName in _decomposedTransformFieldNames
+                }
             variableComponents.append(varCoDict)
         else:
             # Store as a regular component
-            pen.addComponent(
-                component.name,
-                cleanupTransform(component.transformation.toTransform()),
+            regularComponents.append(
+                (
+                    component.name,
+                    cleanupTransform(component.transformation.toTransform()),
+                )
             )
 
     storeInLib(layerGlyph, VARIABLE_COMPONENTS_LIB_KEY, variableComponents)
 
-    return pen.replay
+    def drawPoints(pen):
+        # Draw straight into glifLib's pen, no need to record and replay
+        staticGlyph.path.drawPoints(pen)
+        for baseGlyphName, transformation in regularComponents:
+            pen.addComponent(baseGlyphName, transformation)
+
+    return drawPoints
 
 
 def getGlyphMapFromGlyphSet(glyphSet):
+    glyphsDir = getGlyphSetSysPath(glyphSet)
     glyphMap = {}
-    for glyphName in glyphSet.keys():
-        glifData = glyphSet.getGLIF(glyphName)
+    # The files are read one by one on purpose: reading them from a thread
+    # pool was no faster, as the time is spent in Python code holding the GIL
+    for glyphName in glyphSet.contents:
+        glifData = readGlifHeaderFromGlyphSet(glyphSet, glyphName, glyphsDir)
         gn, codePoints = extractGlyphNameAndCodePoints(glifData)
         assert gn == glyphName, (gn, glyphName)
         glyphMap[glyphName] = codePoints
     return glyphMap
 
 
+def getGlyphSetSysPath(glyphSet):
+    try:
+        return glyphSet.fs.getsyspath("/")
+    except NoSysPath:
+        return None
+
+
+def readGlifHeaderFromGlyphSet(glyphSet, glyphName, glyphsDir):
+    if glyphsDir is None:
+        return glyphSet.getGLIF(glyphName)
+    fileName = glyphSet.contents.get(glyphName)
+    if fileName is None:
+        raise KeyError(glyphName)
+    # Bypass the fs layer, and only read the part of the file we need
+    return readGlifHeader(os.path.join(glyphsDir, fileName))
+
+
 def uniqueNameMaker(existingNames=()):
     usedNames = set(existingNames)
+    # The next count to try per base name, so repeated names don't have to
+    # retry all the counts that were used before
+    nextCounts = {}
 
     def makeUniqueName(name):
-        count = 0
         uniqueName = name
-        while uniqueName in usedNames:
-            count += 1
-            uniqueName = f"{name}#{count}"
+        if uniqueName in usedNames:
+            count = nextCounts.get(name, 1)
+            while (uniqueName := f"{name}#{count}") in usedNames:
+                count += 1
+            nextCounts[name] = count + 1
         usedNames.add(uniqueName)
         return uniqueName
 
     return makeUniqueName
 
 
+_identityTransform = (1, 0, 0, 1, 0, 0)
+
+
+@lru_cache(maxsize=1024)
 def cleanupTransform(t):
     """Convert any integer float values into ints. This is to prevent glifLib
     from writing float values that can be integers."""
-    return tuple(int(v) if int(v) == v else v for v in t)
+    if t == _identityTransform:
+        return _identityTransform
+    cleanedUp = []
+    for v in t:
+        iv = int(v)
+        cleanedUp.append(iv if iv == v else v)
+    return tuple(cleanedUp)
 
 
-def tuplifyLocation(loc):
-    # TODO: find good place to share this (duplicated from opentype.py)
-    return tuple(sorted(loc.items()))
+_noPoles = frozenset()
 
 
 def splitLocationByPolePosition(location, poles):
     atPole = {}
     notAtPole = {}
+    getPoles = poles.get
     for name, value in location.items():
-        if value in poles.get(name, ()):
+        if value in getPoles(name, _noPoles):
             atPole[name] = value
         else:
             notAtPole[name] = value
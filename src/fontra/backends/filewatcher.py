@@ -56,13 +56,19 @@ def cleanupWatchFilesChanges(
     # appropriate one among them:
     # - if there is a delete event and the path does not exist: delete it is
     # - else: keep the lowest sorted event (order: added, modified, deleted)
-    perPath = {}
-    for change, path in sorted(changes):
-        if path in perPath:
-            if change == Change.deleted and not os.path.exists(path):
-                # File doesn't exist, event to "deleted"
-                perPath[path] = Change.deleted
-            # else: keep the first event
-        else:
+    perPath: dict[str, Change] = {}
+    deletedWithOtherEvents: set[str] = set()
+    for change, path in changes:
+        lowestChange = perPath.get(path)
+        if lowestChange is None:
             perPath[path] = change
+            continue
+        if Change.deleted in (change, lowestChange):
+            deletedWithOtherEvents.add(path)
+        if change < lowestChange:
+            perPath[path] = change
+    for path in deletedWithOtherEvents:
+        if not os.path.exists(path):
+            # File doesn't exist, event to "deleted"
+            perPath[path] = Change.deleted
     return {(change, path) for path, change in perPath.items()}
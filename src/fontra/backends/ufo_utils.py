@@ -1,22 +1,59 @@
 import logging
+import os
 import re
+from xml.parsers import expat
 
 from fontTools.ufoLib.filenames import userNameToFileName
 
 logger = logging.getLogger(__name__)
 
 
-_glyphNamePat = re.compile(rb'<glyph\s+name\s*=\s*"([^"]+)"')
-_unicodePat = re.compile(rb'<unicode\s+hex\s*=\s*"([^"]+)"')
+# A single pass over the .glif data: the glyph name, the unicode values, and the
+# <outline> element, after which no more unicodes are expected, so we can stop
+_glifHeaderPat = re.compile(
+    rb'<glyph\s+name\s*=\s*"([^"]+)"|<unicode\s+hex\s*=\s*"([^"]+)"|<outline\b'
+)
+
+
+def extractGlyphNameAndCodePointsFromPath(
+    path: os.PathLike | str,
+) -> tuple[str, list[int]]:
+    return extractGlyphNameAndCodePoints(readGlifHeader(path))
+
+
+def readGlifHeader(path: os.PathLike | str, chunkSize: int = 4096) -> bytes:
+    """Read the start of a .glif file, up to and including the <outline> start
+    tag, or the entire file if it has no <outline> element.
+    """
+    data = b""
+    searchStart = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(chunkSize):
+            data += chunk
+            outlineStart = data.find(b"<outline", searchStart)
+            if outlineStart >= 0:
+                if data.find(b">", outlineStart) >= 0:
+                    break
+                searchStart = outlineStart
+            else:
+                # The tag may be split across chunks
+                searchStart = max(0, len(data) - len(b"<outline") + 1)
+    return data
 
 
 def extractGlyphNameAndCodePoints(
     data: bytes, fileName: str | None = None
 ) -> tuple[str, list[int]]:
-    m = _glyphNamePat.search(data)
-    if m is None:
+    # Scanning is a lot faster than parsing, but it can't decode XML entities,
+    # and it won't find the glyph name if it's not the first attribute
+    glyphName, codePoints = _scanGlifHeader(data)
+    if glyphName is None or "&" in glyphName:
+        try:
+            glyphName, codePoints = _parseGlifHeader(data)
+        except expat.ExpatError:
+            pass
+    if glyphName is None:
         raise ValueError(f"invalid .glif file, glyph name not found ({fileName})")
-    glyphName = m.group(1).decode("utf-8")
     if fileName is not None:
         refFileName = userNameToFileName(glyphName, suffix=".glif")
         if refFileName != fileName:
@@ -24,5 +61,47 @@ def extractGlyphNameAndCodePoints(
                 "actual file name does not match predicted file name: "
                 f"{refFileName} {fileName} {glyphName}"
             )
-    codePoints = [int(u, 16) for u in _unicodePat.findall(data)]
+    return glyphName, codePoints
+
+
+class _StopParsing(Exception):
+    pass
+
+
+def _parseGlifHeader(data: bytes) -> tuple[str | None, list[int]]:
+    glyphName = None
+    codePoints = []
+
+    def startElementHandler(name, attrs):
+        nonlocal glyphName
+        if name == "unicode":
+            hexValue = attrs.get("hex")
+            if hexValue is not None:
+                codePoints.append(int(hexValue, 16))
+        elif name == "outline":
+            raise _StopParsing()
+        elif name == "glyph" and glyphName is None:
+            glyphName = attrs.get("name")
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = startElementHandler
+    try:
+        parser.Parse(data, True)
+    except _StopParsing:
+        pass
+    return glyphName, codePoints
+
+
+def _scanGlifHeader(data: bytes) -> tuple[str | None, list[int]]:
+    glyphName = None
+    codePoints = []
+    for m in _glifHeaderPat.finditer(data):
+        nameMatch, unicodeMatch = m.groups()
+        if unicodeMatch is not None:
+            codePoints.append(int(unicodeMatch, 16))
+        elif nameMatch is not None:
+            if glyphName is None:
+                glyphName = nameMatch.decode("utf-8")
+        else:
+            break
     return glyphName, codePoints
@@ -226,15 +226,19 @@ export class FontController {
       return;
     }
     const glyphName = glyph.name;
-    // Zap previous used-by data for this glyph, if any
-    for (const componentName of this.glyphMadeOf[glyphName] || []) {
-      if (this.glyphUsedBy[componentName]) {
+    const previousComponentNames = this.glyphMadeOf[glyphName] || new Set();
+    const componentNames = glyph.getAllComponentNames();
+    this.glyphMadeOf[glyphName] = componentNames;
+    // Only touch the used-by data for components that were removed or added
+    for (const componentName of previousComponentNames) {
+      if (!componentNames.has(componentName) && this.glyphUsedBy[componentName]) {
         this.glyphUsedBy[componentName].delete(glyphName);
       }
     }
-    const componentNames = glyph.getAllComponentNames();
-    this.glyphMadeOf[glyphName] = componentNames;
     for (const componentName of componentNames) {
+      if (previousComponentNames.has(componentName)) {
+        continue;
+      }
       if (!this.glyphUsedBy[componentName]) {
         this.glyphUsedBy[componentName] = new Set();
       }
@@ -564,44 +568,14 @@ export class FontController {
     return cachedPattern;
   }
 
-  *iterGlyphsMadeOfRecursively(glyphName, seenGlyphNames = null) {
+  *iterGlyphsMadeOfRecursively(glyphName) {
     // Yield the names of all glyphs that are used as a component in `glyphName`, recursively.
-    if (!seenGlyphNames) {
-      seenGlyphNames = new Set();
-    } else if (seenGlyphNames.has(glyphName)) {
-      // Avoid infinite recursion
-      return;
-    }
-    seenGlyphNames.add(glyphName);
-    for (const dependantGlyphName of this.glyphMadeOf[glyphName] || []) {
-      yield dependantGlyphName;
-      for (const deeperGlyphName of this.iterGlyphsMadeOfRecursively(
-        dependantGlyphName,
-        seenGlyphNames
-      )) {
-        yield deeperGlyphName;
-      }
-    }
+    yield* iterDependenciesRecursively(this.glyphMadeOf, glyphName);
   }
 
-  *iterGlyphsUsedByRecursively(glyphName, seenGlyphNames = null) {
+  *iterGlyphsUsedByRecursively(glyphName) {
     // Yield the names of all *loaded* glyphs that use `glyphName` as a component, recursively.
-    if (!seenGlyphNames) {
-      seenGlyphNames = new Set();
-    } else if (seenGlyphNames.has(glyphName)) {
-      // Avoid infinite recursion
-      return;
-    }
-    seenGlyphNames.add(glyphName);
-    for (const dependantGlyphName of this.glyphUsedBy[glyphName] || []) {
-      yield dependantGlyphName;
-      for (const deeperGlyphName of this.iterGlyphsUsedByRecursively(
-        dependantGlyphName,
-        seenGlyphNames
-      )) {
-        yield deeperGlyphName;
-      }
-    }
+    yield* iterDependenciesRecursively(this.glyphUsedBy, glyphName);
   }
 
   async findGlyphsThatUseGlyph(glyphName) {
@@ -610,10 +584,10 @@ export class FontController {
   }
 
   _purgeGlyphCache(glyphName) {
-    this._glyphsPromiseCache.delete(glyphName);
-    this._purgeInstanceCache(glyphName);
-    for (const dependantName of this.glyphUsedBy[glyphName] || []) {
-      this._purgeGlyphCache(dependantName);
+    const glyphNames = [glyphName, ...this.iterGlyphsUsedByRecursively(glyphName)];
+    for (const name of glyphNames) {
+      this._glyphsPromiseCache.delete(name);
+      this._purgeInstanceCache(name);
     }
   }
 
@@ -856,6 +830,26 @@ function collectGlyphNames(change) {
     .map((item) => item[1]);
 }
 
+function* iterDependenciesRecursively(dependencyMap, glyphName) {
+  // Depth-first, with an explicit stack instead of nested generators. Each glyph
+  // name is yielded once, which also guards against cyclic component references.
+  // `glyphName` itself is only yielded if a cycle leads back to it.
+  const seenGlyphNames = new Set();
+  const stack = [...(dependencyMap[glyphName] || [])].reverse();
+  while (stack.length) {
+    const dependantGlyphName = stack.pop();
+    if (seenGlyphNames.has(dependantGlyphName)) {
+      continue;
+    }
+    seenGlyphNames.add(dependantGlyphName);
+    yield dependantGlyphName;
+    const deeperGlyphNames = dependencyMap[dependantGlyphName];
+    if (deeperGlyphNames) {
+      stack.push(...[...deeperGlyphNames].reverse());
+    }
+  }
+}
+
 function setPopFirst(set) {
   if (!set.size) {
     return;
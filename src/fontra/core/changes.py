@@ -1,3 +1,4 @@
+from functools import cache, lru_cache
 from typing import (
     Any,
     Callable,
@@ -14,21 +15,29 @@ from .classes import classCastFuncs, classSchema
 def setItem(subject, key, item, *, itemCast=None):
     if itemCast is not None:
         item = itemCast(item)
-    if isinstance(subject, (MutableMapping, MutableSequence)):
+    if _isSubclass(type(subject), (MutableMapping, MutableSequence)):
         subject[key] = item
     else:
         setattr(subject, key, item)
 
 
 def delAttr(subject, key, *, itemCast=None):
-    if isinstance(subject, Sequence):
+    subjectType = type(subject)
+    if _isSubclass(subjectType, Sequence):
         raise TypeError("can't call delattr on list")
-    elif isinstance(subject, MutableMapping):
+    elif _isSubclass(subjectType, MutableMapping):
         del subject[key]
     else:
         delattr(subject, key)
 
 
+@cache
+def _isSubclass(cls, classInfo):
+    # isinstance() checks against the collections.abc classes are slow, and
+    # only a handful of types are ever tested, so cache the outcome per type
+    return issubclass(cls, classInfo)
+
+
 def delItems(subject, index, deleteCount=1, itemCast=None):
     spliceItems(subject, index, deleteCount)
 
@@ -92,9 +101,9 @@ def applyChange(subject, change):
 
 
 def _applyChange(subject: Any, change: dict[str, Any], *, itemCast=None) -> None:
-    path = change.get("p", [])
+    path = change.get("p", ())
     functionName = change.get("f")
-    children = change.get("c", [])
+    children = change.get("c", ())
 
     for pathElement in path:
         itemCast = None
@@ -106,7 +115,7 @@ def _applyChange(subject: Any, change: dict[str, Any], *, itemCast=None) -> None
 
     if functionName is not None:
         changeFunc: Callable[..., None] = changeFunctions[functionName]
-        args = change.get("a", [])
+        args = change.get("a", ())
         if functionName in baseChangeFunctions:
             if itemCast is None and args:
                 itemCast = getItemCast(subject, args[0], "type")
@@ -119,15 +128,27 @@ def _applyChange(subject: Any, change: dict[str, Any], *, itemCast=None) -> None
 
 
 def getItemCast(subject, attrName, fieldKey):
-    classFields = classSchema.get(type(subject))
-    if classFields is not None:
-        fieldDef = classFields[attrName]
-        subtype = fieldDef.get(fieldKey)
-        if subtype is not None:
-            return classCastFuncs.get(subtype)
+    itemCasts = _getItemCasts(type(subject), fieldKey)
+    if itemCasts is not None:
+        return itemCasts[attrName]
     return None
 
 
+@cache
+def _getItemCasts(cls, fieldKey):
+    # Flatten the schema lookups for `cls` into a single attrName -> cast dict
+    classFields = classSchema.get(cls)
+    if classFields is None:
+        return None
+    itemCasts = {}
+    for attrName, fieldDef in classFields.items():
+        subtype = fieldDef.get(fieldKey)
+        itemCasts[attrName] = (
+            classCastFuncs.get(subtype) if subtype is not None else None
+        )
+    return itemCasts
+
+
 _MISSING = object()
 
 
@@ -142,7 +163,7 @@ def matchChangePattern(
     a leaf node.
     """
     node = matchPattern
-    for pathElement in change.get("p", []):
+    for pathElement in change.get("p", ()):
         childNode = node.get(pathElement, _MISSING)
         if childNode is _MISSING:
             return False
@@ -156,7 +177,7 @@ def matchChangePattern(
         if args and args[0] in node:
             return True
 
-    for childChange in change.get("c", []):
+    for childChange in change.get("c", ()):
         if matchChangePattern(childChange, node):
             return True
 
@@ -179,7 +200,7 @@ def filterChangePattern(
     that match from the return value.
     """
     node = matchPattern
-    for pathElement in change.get("p", []):
+    for pathElement in change.get("p", ()):
         childNode = node.get(pathElement, _MISSING)
         if childNode is _MISSING:
             return change if inverse else None
@@ -195,11 +216,15 @@ def filterChangePattern(
             matchedRootChange = True
 
     filteredChildren = []
-    for childChange in change.get("c", []):
+    for childChange in change.get("c", ()):
         childChange = filterChangePattern(childChange, node, inverse)
         if childChange is not None:
             filteredChildren.append(childChange)
 
+    if not filteredChildren and inverse == matchedRootChange:
+        # Neither the root change nor any children are included
+        return None
+
     result = {**change, "c": filteredChildren}
     if inverse == matchedRootChange:
         # inverse  matchedRootChange
@@ -211,12 +236,19 @@ def filterChangePattern(
         result.pop("f", None)
         result.pop("a", None)
 
-    return _normalizeChange(result)
+    # result is a new dict, no need to copy it again
+    return _normalizeChange(result, inPlace=True)
 
 
-def _normalizeChange(change: dict[str, Any]) -> dict[str, Any] | None:
+def _normalizeChange(
+    change: dict[str, Any], *, inPlace: bool = False
+) -> dict[str, Any] | None:
     children = change.get("c", ())
 
+    if children and change.get("p") and ("f" in change or len(children) > 1):
+        # Already normalized: nothing to merge or remove
+        return change if inPlace else {**change}
+
     result: dict[str, Any] | None
 
     if "f" not in change and len(children) == 1:
@@ -225,7 +257,7 @@ def _normalizeChange(change: dict[str, Any]) -> dict[str, Any] | None:
         # Prefix child path with original root path
         result["p"] = change.get("p", []) + result.get("p", [])
     else:
-        result = {**change}
+        result = change if inPlace else {**change}
 
     if not result.get("p"):
         # Remove empty path
@@ -245,12 +277,21 @@ def _normalizeChange(change: dict[str, Any]) -> dict[str, Any] | None:
     return result
 
 
-def patternFromPath(matchPath: list) -> dict[str | int, Any]:
-    """Given a list of path elements, return a pattern dict."""
+def patternFromPath(matchPath: Sequence) -> dict[str | int, Any]:
+    """Given a list of path elements, return a pattern dict.
+
+    The same paths are requested over and over, so the result is cached: it
+    may be shared and must not be modified.
+    """
+    return _patternFromPath(tuple(matchPath))
+
+
+@lru_cache(maxsize=4096)
+def _patternFromPath(matchPath: tuple) -> dict[str | int, Any]:
     pattern = {}
     if matchPath:
         pattern[matchPath[0]] = (
-            None if len(matchPath) == 1 else patternFromPath(matchPath[1:])
+            None if len(matchPath) == 1 else _patternFromPath(matchPath[1:])
         )
     return pattern
 
@@ -328,9 +369,14 @@ def collectChangePaths(change: dict[str, Any], depth: int) -> list[tuple]:
 def _iterateChangePaths(
     change: dict[str, Any], depth: int, prefix: tuple = ()
 ) -> Generator[tuple, None, None]:
-    path = prefix + tuple(change.get("p", ()))
-    if len(path) >= depth:
-        yield path[:depth]
-        return
-    for childChange in change.get("c", []):
-        yield from _iterateChangePaths(childChange, depth, path)
+    # Depth-first, with an explicit stack instead of nested generators
+    stack = [(change, prefix)]
+    while stack:
+        change, prefix = stack.pop()
+        path = prefix + tuple(change.get("p", ()))
+        if len(path) >= depth:
+            yield path[:depth]
+            continue
+        children = change.get("c")
+        if children:
+            stack.extend((childChange, path) for childChange in reversed(children))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass, field, is_dataclass, replace
-from functools import partial
+from types import NoneType
 from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
 
 import cattrs
@@ -95,7 +95,7 @@ class FontMetric:
     customData: CustomData = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Guideline:
     name: Optional[str] = None
     x: float = 0
@@ -116,7 +116,7 @@ class AxisValueLabel:
     olderSibling: bool = False
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FontAxis:
     name: str  # this identifies the axis
     label: str  # a user friendly label
@@ -143,7 +143,7 @@ class DiscreteFontAxis:
     customData: CustomData = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GlyphAxis:
     name: str
     minValue: float
@@ -152,7 +152,7 @@ class GlyphAxis:
     customData: CustomData = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class VariableGlyph:
     name: str
     axes: list[GlyphAxis] = field(default_factory=list)
@@ -167,7 +167,7 @@ class VariableGlyph:
         return _convertToPathType(self, False)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GlyphSource:
     name: str
     layerName: str
@@ -177,13 +177,13 @@ class GlyphSource:
     customData: CustomData = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Layer:
     glyph: StaticGlyph
     customData: CustomData = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StaticGlyph:
     path: Union[PackedPath, Path] = field(default_factory=PackedPath)
     components: list[Component] = field(default_factory=list)
@@ -200,14 +200,14 @@ class StaticGlyph:
         return replace(self, path=self.path.asPath())
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Component:
     name: str
     transformation: DecomposedTransform = field(default_factory=DecomposedTransform)
     location: Location = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Anchor:
     name: Optional[str]
     x: float
@@ -253,24 +253,26 @@ def makeSchema(*classes, schema=None):
         schema[cls] = classFields
         for name, tp in get_type_hints(cls, cls_globals).items():
             fieldDef = dict(type=tp)
+            origin = get_origin(tp)
+            args = get_args(tp)
             if is_dataclass(tp):
                 makeSchema(tp, schema=schema)
-            elif tp.__name__ == "Optional":
-                [subtype, _] = get_args(tp)
+            elif origin is Union and len(args) == 2 and args[1] is NoneType:
+                # Optional[subtype]
+                subtype = args[0]
                 fieldDef["type"] = subtype
                 fieldDef["optional"] = True
                 if is_dataclass(subtype):
                     makeSchema(subtype, schema=schema)
-            elif tp.__name__ == "list":
-                [subtype] = get_args(tp)
-                if get_origin(subtype) == Union:
+            elif origin is list:
+                [subtype] = args
+                if get_origin(subtype) is Union:
                     for sub in get_args(subtype):
                         makeSchema(sub, schema=schema)
                 fieldDef["subtype"] = subtype
                 if is_dataclass(subtype):
                     makeSchema(subtype, schema=schema)
-            elif tp.__name__ == "dict":
-                args = get_args(tp)
+            elif tp is dict or origin is dict:
                 if not args:
                     continue
                 [keytype, subtype] = args
@@ -278,8 +280,8 @@ def makeSchema(*classes, schema=None):
                 fieldDef["subtype"] = subtype
                 if is_dataclass(subtype):
                     makeSchema(subtype, schema=schema)
-            elif tp.__name__ == "Union":
-                tp = get_args(tp)[0]  # just take the first for now
+            elif origin is Union:
+                tp = args[0]  # just take the first for now
                 fieldDef = dict(type=tp)
                 makeSchema(tp, schema=schema)
             classFields[name] = fieldDef
@@ -446,20 +448,31 @@ def makeCastFuncs(schema):
     castFuncs = {}
 
     for cls, fields in schema.items():
-        castFuncs[cls] = partial(structure, cls=cls)
+        castFuncs[cls] = _makeCastFunc(cls)
         for fieldName, fieldInfo in fields.items():
             fieldType = fieldInfo["type"]
             if fieldType not in atomicTypes and fieldType not in schema:
                 itemType = get_args(fieldType)[-1]
                 if itemType not in atomicTypes:
-                    castFuncs[fieldType] = partial(structure, cls=fieldType)
+                    castFuncs[fieldType] = _makeCastFunc(fieldType)
             subType = fieldInfo.get("subtype")
             if subType not in atomicTypes and subType not in schema:
-                castFuncs[subType] = partial(structure, cls=subType)
+                castFuncs[subType] = _makeCastFunc(subType)
 
     return castFuncs
 
 
+def _makeCastFunc(cls):
+    # Call the converter directly, which is cheaper than a partial() of
+    # structure(). Its dispatch is cached by cattrs.
+    structureFunc = _cattrsConverter.structure
+
+    def castFunc(obj):
+        return structureFunc(obj, cls)
+
+    return castFunc
+
+
 def classesToStrings(schema):
     return {
         cls.__name__: {
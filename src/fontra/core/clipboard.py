@@ -1,10 +1,7 @@
 from typing import Any
 from xml.etree.ElementTree import ParseError
 
-from fontTools.pens.boundsPen import ControlBoundsPen
 from fontTools.pens.pointPen import GuessSmoothPointPen, SegmentToPointPen
-from fontTools.pens.recordingPen import RecordingPen
-from fontTools.pens.transformPen import TransformPointPen
 from fontTools.svgLib import SVGPath
 from fontTools.ufoLib.errors import GlifLibError
 from fontTools.ufoLib.glifLib import readGlyphFromString, writeGlyphToString
@@ -28,10 +25,16 @@ else:
     XMLErrors = (ParseError, XMLSyntaxError)
 
 
+# The format can be told from the start of the data, after any XML declaration,
+# comments or doctype. Don't scan all of a possibly large clipboard for it.
+_clipboardHeadSize = 8192
+
+
 def parseClipboard(data: str) -> StaticGlyph | None:
-    if "<svg" in data:
+    head = data[:_clipboardHeadSize]
+    if "<svg" in head:
         return parseSVG(data)
-    if "<?xml" in data and "<glyph " in data:
+    if "<?xml" in head and "<glyph " in head:
         return parseGLIF(data)
     return None
 
@@ -43,19 +46,21 @@ def parseSVG(data: str) -> StaticGlyph | None:
         )
     except XMLErrors:
         return None
-    recPen = RecordingPen()
-    svgPath.draw(recPen)
-    boundsPen = ControlBoundsPen(None)
-    recPen.replay(boundsPen)
-    if boundsPen.bounds is None:
+    pen = PackedPathPointPen()
+    svgPath.draw(SegmentToPointPen(GuessSmoothPointPen(pen)))
+    path = pen.getPath()
+    coordinates = path.coordinates
+    if not coordinates:
         return None
-    xMin, yMin, xMax, yMax = boundsPen.bounds
 
-    pen = PackedPathPointPen()
-    tPen = TransformPointPen(pen, (1, 0, 0, 1, 0, -yMin))
-    recPen.replay(SegmentToPointPen(GuessSmoothPointPen(tPen)))
+    # Compute the control bounds from the packed coordinates, and shift the
+    # outline up so it sits on the baseline, instead of drawing twice
+    xMax = max(coordinates[0::2])
+    yMin = min(coordinates[1::2])
+    if yMin:
+        coordinates[1::2] = [y - yMin for y in coordinates[1::2]]
 
-    return StaticGlyph(path=pen.getPath(), xAdvance=xMax)
+    return StaticGlyph(path=path, xAdvance=xMax)
 
 
 def parseGLIF(data: str) -> StaticGlyph | None:
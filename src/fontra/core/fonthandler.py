@@ -2,8 +2,9 @@ import asyncio
 import functools
 import logging
 import traceback
-from collections import UserDict, defaultdict
-from contextlib import asynccontextmanager
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
+from contextlib import asynccontextmanager, nullcontext
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import cached_property
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 CHANGES_PATTERN_KEY = "changes-match-pattern"
 LIVE_CHANGES_PATTERN_KEY = "live-changes-match-pattern"
+COMBINED_CHANGES_PATTERN_KEY = "combined-changes-match-pattern"
 
 
 def remoteMethod(method):
@@ -48,7 +50,9 @@ class FontHandler:
         self.connections = set()
         self.clientData = defaultdict(dict)
         self.localData = LRUCache()
-        self._dataScheduledForWriting = {}
+        # Popping the oldest item from a plain dict gets slower as the deleted
+        # entries at its start pile up; OrderedDict pops from the front in O(1)
+        self._dataScheduledForWriting = OrderedDict()
         self.glyphMap = {}
         if hasattr(self.backend, "startOptionalBackgroundTasks"):
             self.backend.startOptionalBackgroundTasks()
@@ -116,27 +120,30 @@ class FontHandler:
         writeFunc: Callable[
             [], Awaitable[None]
         ]  # inferencing with partial() goes wrong
-        while self._dataScheduledForWriting:
-            writeKey, (writeFunc, connection) = popFirstItem(
-                self._dataScheduledForWriting
-            )
-            reloadPattern = _writeKeyToPattern(writeKey)
-            logger.info(f"write {writeKey} to backend")
-            try:
-                await writeFunc()
-            except Exception as e:
-                logger.error("exception while writing data: %r", e)
-                traceback.print_exc()
-                await self.reloadData(reloadPattern)
-                if connection is not None:
-                    await connection.proxy.messageFromServer(
-                        "The data could not be saved due to an error.",
-                        f"The edit has been reverted.\n\n{e!r}",
-                    )
-                else:
-                    # No connection to inform, let's error
-                    raise
-            await asyncio.sleep(0)
+        # Let the backend batch work that is shared between writes, such as
+        # updating an index file, until the end of the cycle
+        batchedWrites = getattr(self.backend, "batchedWrites", nullcontext)
+        with batchedWrites():
+            while self._dataScheduledForWriting:
+                writeKey, writeInfo = self._dataScheduledForWriting.popitem(last=False)
+                writeFunc, connection = writeInfo
+                reloadPattern = _writeKeyToPattern(writeKey)
+                logger.info(f"write {writeKey} to backend")
+                try:
+                    await writeFunc()
+                except Exception as e:
+                    logger.error("exception while writing data: %r", e)
+                    traceback.print_exc()
+                    await self.reloadData(reloadPattern)
+                    if connection is not None:
+                        await connection.proxy.messageFromServer(
+                            "The data could not be saved due to an error.",
+                            f"The edit has been reverted.\n\n{e!r}",
+                        )
+                    else:
+                        # No connection to inform, let's error
+                        raise
+                await asyncio.sleep(0)
 
     @asynccontextmanager
     async def useConnection(self, connection) -> AsyncGenerator[None, None]:
@@ -276,6 +283,15 @@ class FontHandler:
         key = LIVE_CHANGES_PATTERN_KEY if wantLiveChanges else CHANGES_PATTERN_KEY
         matchPattern = self._getClientData(connection, key, {})
         self._setClientData(connection, key, func(matchPattern, pathOrPattern))
+        # Subscriptions change far less often than data gets reloaded, so keep
+        # the union of both patterns up to date here
+        patternA, patternB = [
+            self._getClientData(connection, key, {})
+            for key in [LIVE_CHANGES_PATTERN_KEY, CHANGES_PATTERN_KEY]
+        ]
+        self._setClientData(
+            connection, COMBINED_CHANGES_PATTERN_KEY, patternUnion(patternA, patternB)
+        )
 
     @remoteMethod
     async def editIncremental(self, liveChange, *, connection):
@@ -293,6 +309,10 @@ class FontHandler:
             await self.broadcastChange(finalChange, connection, False)
 
     async def broadcastChange(self, change, sourceConnection, isLiveChange):
+        if self.connections.issubset((sourceConnection,)):
+            # Nobody else to tell, which is the common single-editor case
+            return
+
         if isLiveChange:
             matchPatternKeys = [LIVE_CHANGES_PATTERN_KEY]
         else:
@@ -303,8 +323,10 @@ class FontHandler:
             for connection in self.connections
             if connection != sourceConnection
             and any(
-                matchChangePattern(change, self._getClientData(connection, k, {}))
+                matchChangePattern(change, pattern)
                 for k in matchPatternKeys
+                # Clients that subscribed to nothing can't match
+                if (pattern := self._getClientData(connection, k))
             )
         ]
 
@@ -363,10 +385,11 @@ class FontHandler:
                     for key, glyphName in collectChangePaths(change, 2)
                     if key == "glyphs"
                 ]
-                glyphSet = {
-                    glyphName: await self.getGlyph(glyphName)
-                    for glyphName in glyphNames
-                }
+                # Load the glyphs concurrently, so backend I/O can overlap
+                glyphs = await asyncio.gather(
+                    *[self.getGlyph(glyphName) for glyphName in glyphNames]
+                )
+                glyphSet = dict(zip(glyphNames, glyphs))
                 glyphSet = DictSetDelTracker(glyphSet)
                 rootObject.glyphs = glyphSet
             else:
@@ -384,31 +407,32 @@ class FontHandler:
         for rootKey in rootKeys + sorted(rootObject._assignedAttributeNames):
             if rootKey == "glyphs":
                 glyphSet = rootObject.glyphs
+                for glyphName in glyphSet.newKeys:
+                    self.localData[("glyphs", glyphName)] = glyphSet[glyphName]
+                for glyphName in glyphSet.deletedKeys:
+                    _ = self.localData.pop(("glyphs", glyphName), None)
+                if not writeToBackEnd:
+                    continue
+                assert self.writableBackend is not None
                 glyphMap = await self.getData("glyphMap")
                 for glyphName in sorted(glyphSet.keys()):
-                    writeKey = ("glyphs", glyphName)
-                    if glyphName in glyphSet.newKeys:
-                        self.localData[writeKey] = glyphSet[glyphName]
-                    if not writeToBackEnd:
-                        continue
-                    assert self.writableBackend is not None
                     writeFunc = functools.partial(
+                        _callWithCopy,
                         self.writableBackend.putGlyph,
                         glyphName,
-                        deepcopy(glyphSet[glyphName]),
+                        glyphSet[glyphName],
                         glyphMap.get(glyphName, []),
                     )
-                    await self.scheduleDataWrite(writeKey, writeFunc, sourceConnection)
+                    await self.scheduleDataWrite(
+                        ("glyphs", glyphName), writeFunc, sourceConnection
+                    )
                 for glyphName in sorted(glyphSet.deletedKeys):
-                    writeKey = ("glyphs", glyphName)
-                    _ = self.localData.pop(writeKey, None)
-                    if not writeToBackEnd:
-                        continue
-                    assert self.writableBackend is not None
                     writeFunc = functools.partial(
                         self.writableBackend.deleteGlyph, glyphName
                     )
-                    await self.scheduleDataWrite(writeKey, writeFunc, sourceConnection)
+                    await self.scheduleDataWrite(
+                        ("glyphs", glyphName), writeFunc, sourceConnection
+                    )
             else:
                 if rootKey in rootObject._assignedAttributeNames:
                     self.localData[rootKey] = getattr(rootObject, rootKey)
@@ -416,7 +440,7 @@ class FontHandler:
                     continue
                 assert self.writableBackend is not None
                 writeFunc = functools.partial(
-                    self._putData, rootKey, deepcopy(self.localData[rootKey])
+                    _callWithCopy, self._putData, rootKey, self.localData[rootKey]
                 )
                 await self.scheduleDataWrite(rootKey, writeFunc, sourceConnection)
 
@@ -476,16 +500,7 @@ class FontHandler:
         )
 
     def _getCombinedSubscribePattern(self, connection):
-        patternA, patternB = [
-            self._getClientData(connection, key, {})
-            for key in [LIVE_CHANGES_PATTERN_KEY, CHANGES_PATTERN_KEY]
-        ]
-        return patternUnion(patternA, patternB)
-
-
-def popFirstItem(d):
-    key = next(iter(d))
-    return (key, d.pop(key))
+        return self._getClientData(connection, COMBINED_CHANGES_PATTERN_KEY, {})
 
 
 _tasks = set()
@@ -505,6 +520,14 @@ def scheduleTaskAndLogException(awaitable):
     return task
 
 
+def _callWithCopy(func, key, value, *args):
+    # The backend gets a copy of the value, so editing can continue while it
+    # writes. The copy is made when the write is performed, not when it is
+    # scheduled: a pending write that gets replaced by a newer one for the same
+    # key never pays for a copy.
+    return func(key, deepcopy(value), *args)
+
+
 def _writeKeyToPattern(writeKey):
     if not isinstance(writeKey, tuple):
         writeKey = (writeKey,)
@@ -519,25 +542,41 @@ def _ensurePattern(pathOrPattern):
     )
 
 
-class DictSetDelTracker(UserDict):
+class DictSetDelTracker(MutableMapping):
+    # Deliberately not a UserDict: only the methods applyChange() needs are
+    # implemented, directly on the wrapped dict
+
+    __slots__ = ("data", "newKeys", "deletedKeys")
+
     def __init__(self, data):
-        super().__init__()
         self.data = data  # no copy
         self.newKeys = set()
         self.deletedKeys = set()
 
+    def __getitem__(self, key):
+        return self.data[key]
+
     def __setitem__(self, key, value):
-        isNewItem = key not in self
-        super().__setitem__(key, value)
+        isNewItem = key not in self.data
+        self.data[key] = value
         if isNewItem:
             self.newKeys.add(key)
             self.deletedKeys.discard(key)
 
     def __delitem__(self, key):
-        _ = self.pop(key, None)
+        _ = self.data.pop(key, None)
         self.deletedKeys.add(key)
         self.newKeys.discard(key)
 
+    def __contains__(self, key):
+        return key in self.data
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
 
 def computeGlyphMapChange(glyphMapA, glyphMapB):
     itemsA = sorted(glyphMapA.items())
@@ -583,20 +622,25 @@ def makeGlyphMapChange(glyphMapUpdates):
     if not glyphMapUpdates:
         return None
 
-    changes = [
-        {"f": "=", "a": [glyphName, codePoints]}
-        for glyphName, codePoints in glyphMapUpdates.items()
-        if codePoints is not None
-    ] + [
-        {"f": "d", "a": [glyphName]}
-        for glyphName, codePoints in glyphMapUpdates.items()
-        if codePoints is None
-    ]
-
     glyphMapChange = {"p": ["glyphMap"]}
-    if len(changes) == 1:
-        glyphMapChange.update(changes[0])
-    else:
-        glyphMapChange["c"] = changes
+
+    if len(glyphMapUpdates) == 1:
+        [(glyphName, codePoints)] = glyphMapUpdates.items()
+        if codePoints is not None:
+            glyphMapChange.update({"f": "=", "a": [glyphName, codePoints]})
+        else:
+            glyphMapChange.update({"f": "d", "a": [glyphName]})
+        return glyphMapChange
+
+    # Single pass; all set operations go before all delete operations
+    setChanges = []
+    deleteChanges = []
+    for glyphName, codePoints in glyphMapUpdates.items():
+        if codePoints is not None:
+            setChanges.append({"f": "=", "a": [glyphName, codePoints]})
+        else:
+            deleteChanges.append({"f": "d", "a": [glyphName]})
+
+    glyphMapChange["c"] = setChanges + deleteChanges
 
     return glyphMapChange
@@ -8,22 +8,25 @@ class GlyphDependencies:
     madeOf: dict[str, set[str]] = field(init=False, default_factory=dict)
 
     def update(self, glyphName: str, componentNames: Sequence[str]) -> None:
-        # Zap previous used-by data for this glyph, if any
-        for componentName in self.madeOf.get(glyphName, ()):
-            if componentName in self.usedBy:
-                self.usedBy[componentName].discard(glyphName)
-                if not self.usedBy[componentName]:
-                    del self.usedBy[componentName]
+        newComponentNames = set(componentNames)
+        oldComponentNames = self.madeOf.get(glyphName, set())
 
         # Update made-of
-        if componentNames:
-            self.madeOf[glyphName] = set(componentNames)
+        if newComponentNames:
+            self.madeOf[glyphName] = newComponentNames
         else:
             # Discard
             self.madeOf.pop(glyphName, None)
 
-        # Update used-by
-        for componentName in componentNames:
+        # Update used-by, only for the components that were removed or added
+        for componentName in oldComponentNames - newComponentNames:
+            usedBy = self.usedBy.get(componentName)
+            if usedBy is not None:
+                usedBy.discard(glyphName)
+                if not usedBy:
+                    del self.usedBy[componentName]
+
+        for componentName in newComponentNames - oldComponentNames:
             if componentName not in self.usedBy:
                 self.usedBy[componentName] = set()
             self.usedBy[componentName].add(glyphName)
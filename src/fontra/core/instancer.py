@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, fields, replace
 from enum import Enum
 from functools import cached_property, partial, singledispatch
 from typing import Any, Iterable
@@ -505,19 +505,13 @@ def _(v: None, scalar):
 
 def _dataClassOperator(v1, v2, op):
     return type(v1)(
-        **{
-            attrName: op(attrValue, getattr(v2, attrName))
-            for attrName, attrValue in v1.__dict__.items()
-        }
+        **{f.name: op(getattr(v1, f.name), getattr(v2, f.name)) for f in fields(v1)}
     )
 
 
 def _dataClassMul(v1, scalar):
     return type(v1)(
-        **{
-            attrName: multiply(attrValue, scalar)
-            for attrName, attrValue in v1.__dict__.items()
-        }
+        **{f.name: multiply(getattr(v1, f.name), scalar) for f in fields(v1)}
     )
 
 
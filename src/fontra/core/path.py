@@ -4,6 +4,7 @@ import logging
 from copy import copy
 from dataclasses import dataclass, field, replace
 from enum import IntEnum
+from itertools import chain
 from typing import TypedDict
 
 from fontTools.misc.roundTools import otRound
@@ -57,7 +58,7 @@ class Path:
 # Packed Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ContourInfo:
     endPoint: int
     isClosed: bool = False
@@ -81,13 +82,23 @@ class PackedPath:
         coordinates = []
         pointTypes = []
         contourInfo = []
-        packedContours = [_packContour(c) for c in unpackedContours]
-        for packedContour in packedContours:
-            coordinates.extend(packedContour["coordinates"])
-            pointTypes.extend(packedContour["pointTypes"])
+        # Fill the result lists directly, without packing each contour into
+        # temporary lists first
+        appendCoordinate = coordinates.append
+        appendPointType = pointTypes.append
+        getPointType = _packedPointTypes.get
+        for unpackedContour in unpackedContours:
+            for point in unpackedContour["points"]:
+                appendCoordinate(point["x"])
+                appendCoordinate(point["y"])
+                pointTypeKey = (point.get("type"), point.get("smooth"))
+                pointType = getPointType(pointTypeKey)
+                if pointType is None:
+                    pointType = _packPointType(*pointTypeKey)
+                appendPointType(pointType)
             contourInfo.append(
                 ContourInfo(
-                    endPoint=len(pointTypes) - 1, isClosed=packedContour["isClosed"]
+                    endPoint=len(pointTypes) - 1, isClosed=unpackedContour["isClosed"]
                 )
             )
         return cls(
@@ -133,54 +144,64 @@ class PackedPath:
         startIndex = 0
         for contourInfo in self.contourInfo:
             endIndex = contourInfo.endPoint + 1
-            points = list(_iterPoints(coordinates, pointTypes, startIndex, endIndex))
+            points = _unpackPoints(coordinates, pointTypes, startIndex, endIndex)
             unpackedContours.append(dict(points=points, isClosed=contourInfo.isClosed))
             startIndex = endIndex
         return unpackedContours
 
     def drawPoints(self, pen) -> None:
-        startPoint = 0
+        allCoordinates = self.coordinates
+        allPointTypes = self.pointTypes
+        getSegmentType = _pointToSegmentType.get
+        # Comparing against local names avoids a global + enum attribute lookup
+        # per point
+        onCurve = PointType.ON_CURVE
+        onCurveSmooth = PointType.ON_CURVE_SMOOTH
+        addPoint = pen.addPoint
+        nextStartPoint = 0
         for contourInfo in self.contourInfo:
-            endIndex = contourInfo.endPoint + 1
-            coordinates = self.coordinates[startPoint * 2 : endIndex * 2]
-            points = list(pairwise(coordinates))
-            pointTypes = self.pointTypes[startPoint:endIndex]
+            startPoint = nextStartPoint
+            endIndex = nextStartPoint = contourInfo.endPoint + 1
             if not contourInfo.isClosed:
                 # strip leading and trailing off-curve points, they cause
                 # validation problems
-                for index in [-1, 0]:
-                    while pointTypes and pointTypes[index] in (
-                        PointType.OFF_CURVE_QUAD,
-                        PointType.OFF_CURVE_CUBIC,
-                    ):
-                        del points[index]
-                        del pointTypes[index]
-            if not pointTypes:
+                while (
+                    startPoint < endIndex
+                    and allPointTypes[endIndex - 1] in _offCurvePointTypes
+                ):
+                    endIndex -= 1
+                while (
+                    startPoint < endIndex
+                    and allPointTypes[startPoint] in _offCurvePointTypes
+                ):
+                    startPoint += 1
+            if startPoint == endIndex:
                 # Don't write empty contours
                 continue
-            assert len(points) == len(pointTypes)
+            pointTypes = allPointTypes[startPoint:endIndex]
+            # pairwise() over a slice beats indexing the coordinates per point
+            points = pairwise(allCoordinates[startPoint * 2 : endIndex * 2])
             pen.beginPath()
             segmentType = (
-                _pointToSegmentType.get(pointTypes[-1], "line")
+                getSegmentType(pointTypes[-1], "line")
                 if contourInfo.isClosed
                 else "move"
             )
             for point, pointType in zip(points, pointTypes):
                 isSmooth = False
                 pointSegmentType = None
-                if pointType == PointType.ON_CURVE:
+                if pointType == onCurve:
                     pointSegmentType = segmentType
-                elif pointType == PointType.ON_CURVE_SMOOTH:
+                elif pointType == onCurveSmooth:
                     pointSegmentType = segmentType
                     isSmooth = True
-                pen.addPoint(
+                addPoint(
                     point,
                     segmentType=pointSegmentType,
                     smooth=isSmooth,
                 )
-                segmentType = _pointToSegmentType.get(pointType, "line")
+                segmentType = getSegmentType(pointType, "line")
             pen.endPath()
-            startPoint = endIndex
 
     def getControlBounds(self):
         if not self.coordinates:
@@ -323,11 +344,8 @@ class PackedPathPointPen:
         self._currentContour = None
 
     def getPath(self) -> PackedPath:
-        return PackedPath(
-            self.coordinates,
-            [PointType(tp) for tp in self.pointTypes],
-            self.contourInfo,
-        )
+        # endPath() only stores PointType members, no need to convert
+        return PackedPath(self.coordinates, self.pointTypes, self.contourInfo)
 
     def beginPath(self, **kwargs) -> None:
         self._currentContour = []
@@ -336,41 +354,39 @@ class PackedPathPointPen:
         self._currentContour.append((pt, segmentType, smooth))
 
     def endPath(self) -> None:
-        if not self._currentContour:
+        currentContour = self._currentContour
+        if not currentContour:
             return
-        isClosed = self._currentContour[0][1] != "move"
-        isQuadBlob = all(
-            segmentType is None for _, segmentType, _ in self._currentContour
-        )
-        if isQuadBlob:
-            self.pointTypes.extend(
-                [PointType.OFF_CURVE_QUAD] * len(self._currentContour)
-            )
-            for pt, _, _ in self._currentContour:
-                self.coordinates.extend(pt)
+        isClosed = currentContour[0][1] != "move"
+        if all(segmentType is None for _, segmentType, _ in currentContour):
+            # Quad blob
+            pointTypes = [PointType.OFF_CURVE_QUAD] * len(currentContour)
         else:
+            offCurveCubic = PointType.OFF_CURVE_CUBIC
+            onCurve = PointType.ON_CURVE
+            onCurveSmooth = PointType.ON_CURVE_SMOOTH
             pointTypes = []
-            for pt, segmentType, smooth in self._currentContour:
+            hasQCurve = False
+            for _, segmentType, smooth in currentContour:
                 if segmentType is None:
-                    pointTypes.append(PointType.OFF_CURVE_CUBIC)
-                elif segmentType in {"move", "line", "curve", "qcurve"}:
-                    pointTypes.append(
-                        PointType.ON_CURVE_SMOOTH if smooth else PointType.ON_CURVE
-                    )
+                    pointTypes.append(offCurveCubic)
+                elif segmentType in _onCurveSegmentTypes:
+                    pointTypes.append(onCurveSmooth if smooth else onCurve)
+                    if segmentType == "qcurve":
+                        hasQCurve = True
                 else:
                     raise TypeError(f"unexpected segment type: {segmentType}")
-
-                self.coordinates.extend(pt)
-            assert len(pointTypes) == len(self._currentContour)
-            # Fix the quad point types
-            for i, (_, segmentType, _) in enumerate(self._currentContour):
-                if segmentType == "qcurve":
-                    stopIndex = i - len(pointTypes) if isClosed else -1
-                    for j in range(i - 1, stopIndex, -1):
-                        if pointTypes[j] != PointType.OFF_CURVE_CUBIC:
-                            break
-                        pointTypes[j] = PointType.OFF_CURVE_QUAD
-            self.pointTypes.extend(pointTypes)
+            if hasQCurve:
+                # Fix the quad point types
+                for i, (_, segmentType, _) in enumerate(currentContour):
+                    if segmentType == "qcurve":
+                        stopIndex = i - len(pointTypes) if isClosed else -1
+                        for j in range(i - 1, stopIndex, -1):
+                            if pointTypes[j] != offCurveCubic:
+                                break
+                            pointTypes[j] = PointType.OFF_CURVE_QUAD
+        self.coordinates.extend(chain.from_iterable(pt for pt, _, _ in currentContour))
+        self.pointTypes.extend(pointTypes)
         self.contourInfo.append(
             ContourInfo(endPoint=len(self.coordinates) // 2 - 1, isClosed=isClosed)
         )
@@ -402,6 +418,12 @@ def copyContourInfo(contourInfo):
     return [ContourInfo(cont.endPoint, cont.isClosed) for cont in contourInfo]
 
 
+_offCurvePointTypes = frozenset([PointType.OFF_CURVE_QUAD, PointType.OFF_CURVE_CUBIC])
+
+
+_onCurveSegmentTypes = frozenset(["move", "line", "curve", "qcurve"])
+
+
 _pointToSegmentType = {
     PointType.OFF_CURVE_CUBIC: "curve",
     PointType.OFF_CURVE_QUAD: "qcurve",
@@ -413,34 +435,39 @@ def pairwise(iterable):
     return zip(it, it)
 
 
-def _iterPoints(coordinates, pointTypes, startIndex, endIndex):
-    for i in range(startIndex, endIndex):
-        point = dict(x=coordinates[i * 2], y=coordinates[i * 2 + 1])
-        pointType = pointTypes[i]
-        if pointType == PointType.OFF_CURVE_CUBIC:
-            point["type"] = "cubic"
-        elif pointType == PointType.OFF_CURVE_QUAD:
-            point["type"] = "quad"
-        elif pointType == PointType.ON_CURVE_SMOOTH:
-            point["smooth"] = True
-        yield point
-
-
-def _packContour(unpackedContour):
-    coordinates = []
-    pointTypes = []
-    for point in unpackedContour["points"]:
-        coordinates.append(point["x"])
-        coordinates.append(point["y"])
-        pointTypes.append(packPointType(point.get("type"), point.get("smooth")))
-    return dict(
-        coordinates=coordinates,
-        pointTypes=pointTypes,
-        isClosed=unpackedContour["isClosed"],
-    )
+_pointTypeAttributes = {
+    PointType.OFF_CURVE_CUBIC: ("type", "cubic"),
+    PointType.OFF_CURVE_QUAD: ("type", "quad"),
+    PointType.ON_CURVE_SMOOTH: ("smooth", True),
+}
+
+
+def _unpackPoints(coordinates, pointTypes, startIndex, endIndex):
+    # Slicing and zipping avoids per-point index arithmetic, and a dict lookup
+    # avoids comparing against PointType members, which is slow
+    points = []
+    for x, y, pointType in zip(
+        coordinates[startIndex * 2 : endIndex * 2 : 2],
+        coordinates[startIndex * 2 + 1 : endIndex * 2 : 2],
+        pointTypes[startIndex:endIndex],
+    ):
+        point = {"x": x, "y": y}
+        attribute = _pointTypeAttributes.get(pointType)
+        if attribute is not None:
+            key, value = attribute
+            point[key] = value
+        points.append(point)
+    return points
 
 
 def packPointType(type, smooth):
+    pointType = _packedPointTypes.get((type, smooth))
+    if pointType is None:
+        pointType = _packPointType(type, smooth)
+    return pointType
+
+
+def _packPointType(type, smooth):
     if type:
         pointType = (
             PointType.OFF_CURVE_CUBIC if type == "cubic" else PointType.OFF_CURVE_QUAD
@@ -452,6 +479,15 @@ def packPointType(type, smooth):
     return pointType
 
 
+# All the (type, smooth) combinations that occur in practice, so packPointType()
+# can do a single dict lookup instead of comparing strings
+_packedPointTypes = {
+    (type, smooth): _packPointType(type, smooth)
+    for type in [None, "cubic", "quad"]
+    for smooth in [None, False, True]
+}
+
+
 #
 # 1. A conceptual hack making an empty Path equal an empty PackedPath, so that
 # cattrs can know to omit an empty path for a Union[PackedPath, Path] field,
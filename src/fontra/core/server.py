@@ -48,7 +48,8 @@ mimeTypes = {
 @dataclass(kw_only=True)
 class FontraServer:
     host: str
-    httpPort: int
+    httpPort: Optional[int] = None
+    defaultHTTPPort: int = 8000
     projectManager: ProjectManager
     launchWebBrowser: bool = False
     versionToken: Optional[str] = None
@@ -102,6 +103,19 @@ class FontraServer:
         self._activeWebsockets: set = set()
 
     def run(self, showLaunchBanner: bool = True) -> None:
+        httpSockets: list[socket.socket] = []
+        if self.httpPort is None:
+            # Keep the sockets bound while searching for a free port, so no
+            # other process can grab the port before the server starts
+            httpSockets = bindFreeTCPSockets(self.host, self.defaultHTTPPort)
+            self.httpPort = httpSockets[0].getsockname()[1]
+        try:
+            self._run(httpSockets, showLaunchBanner)
+        finally:
+            for tcp in httpSockets:
+                tcp.close()
+
+    def _run(self, httpSockets: list[socket.socket], showLaunchBanner: bool) -> None:
         host = self.host
         httpPort = self.httpPort
         if showLaunchBanner:
@@ -115,7 +129,10 @@ class FontraServer:
             print(f"|      http://{host}:{httpPort}/{pad}              |")
             print("|                                                   |")
             print("+---------------------------------------------------+")
-        web.run_app(self.httpApp, host=host, port=httpPort)
+        if httpSockets:
+            web.run_app(self.httpApp, sock=httpSockets)
+        else:
+            web.run_app(self.httpApp, host=host, port=httpPort)
 
     async def launchWebBrowserCallback(self, httpApp: web.Application) -> None:
         import asyncio
@@ -356,3 +373,51 @@ def findFreeTCPPort(startPort: int = 8000) -> int:
         finally:
             tcp.close()
     return port
+
+
+def bindFreeTCPSockets(host: str, startPort: int = 8000) -> list[socket.socket]:
+    """Return sockets bound to all addresses `host` resolves to, using the
+    first port from `startPort` onwards that is free on all of them.
+
+    Like asyncio's create_server(), skip addresses we can't create or bind a
+    socket for, for example IPv6 ones when IPv6 is disabled. Only raise if no
+    socket could be bound at all.
+    """
+    # getaddrinfo() may list the same address more than once
+    addresses = {
+        (family, sockaddr[0]): None
+        for family, _, _, _, sockaddr in socket.getaddrinfo(
+            host, startPort, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+        )
+    }
+    port = startPort
+    while True:
+        sockets: list[socket.socket] = []
+        error: OSError | None = None
+        for family, address in addresses:
+            try:
+                tcp = socket.socket(family, socket.SOCK_STREAM)
+            except OSError as e:
+                error = e
+                continue
+            try:
+                if family == socket.AF_INET6:
+                    # Don't let the IPv6 socket claim the IPv4 address as well
+                    tcp.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, True)
+                tcp.bind((address, port))
+            except OSError as e:
+                tcp.close()
+                if e.errno == errno.EADDRINUSE:
+                    break
+                error = e
+            else:
+                sockets.append(tcp)
+        else:
+            if not sockets:
+                assert error is not None
+                raise error
+            return sockets
+        # The port is in use on one of the addresses: try the next one
+        for tcp in sockets:
+            tcp.close()
+        port += 1
@@ -0,0 +1,46 @@
+import { expect } from "chai";
+
+import { FontController } from "../src/fontra/client/core/font-controller.js";
+import { enumerate } from "../src/fontra/client/core/utils.js";
+
+describe("FontController dependency tests", () => {
+  const glyphUsedBy = {
+    A: ["Aacute", "Adieresis"],
+    Aacute: ["Aacute.alt"],
+    Adieresis: ["Aacute.alt"],
+    cycle1: ["cycle2"],
+    cycle2: ["cycle3", "cycle1"],
+    cycle3: ["cycle2"],
+    self: ["self"],
+  };
+
+  const iterGlyphsUsedByRecursively_testData = [
+    ["B", []],
+    ["Aacute", ["Aacute.alt"]],
+    ["A", ["Aacute", "Aacute.alt", "Adieresis"]],
+    ["cycle1", ["cycle2", "cycle3", "cycle1"]],
+    ["self", ["self"]],
+  ];
+
+  for (const [i, [glyphName, expectedGlyphNames]] of enumerate(
+    iterGlyphsUsedByRecursively_testData
+  )) {
+    it(`iterGlyphsUsedByRecursively test ${i}`, () => {
+      const fontController = new FontController(null);
+      fontController.glyphUsedBy = glyphUsedBy;
+      expect([...fontController.iterGlyphsUsedByRecursively(glyphName)]).to.deep.equal(
+        expectedGlyphNames
+      );
+    });
+  }
+
+  it("iterGlyphsMadeOfRecursively test", () => {
+    const fontController = new FontController(null);
+    fontController.glyphMadeOf = { Aacute: ["A", "acute"], A: ["Aacute"] };
+    expect([...fontController.iterGlyphsMadeOfRecursively("Aacute")]).to.deep.equal([
+      "A",
+      "Aacute",
+      "acute",
+    ]);
+  });
+});
@@ -7,7 +7,12 @@ import pytest
 from fontTools.designspaceLib import DesignSpaceDocument
 
 from fontra.backends import getFileSystemBackend, newFileSystemBackend
-from fontra.backends.designspace import DesignspaceBackend, UFOBackend
+from fontra.backends.designspace import (
+    DesignspaceBackend,
+    UFOBackend,
+    readGlyphOrCreate,
+    uniqueNameMaker,
+)
 from fontra.core.classes import (
     Anchor,
     Axes,
@@ -94,6 +99,37 @@ async def test_roundTripGlyph(writableTestFont, glyphName):
     assert existingData == newData  # just in case the keys differ
 
 
+async def test_getGlyphReturnsFreshObjects(writableTestFont):
+    glyph = await writableTestFont.getGlyph("A")
+    layerGlyph = glyph.layers["MutatorSansLightCondensed/foreground"].glyph
+    originalXAdvance = layerGlyph.xAdvance
+    layerGlyph.xAdvance = originalXAdvance + 100
+    glyph.customData["test"] = 123
+
+    glyph = await writableTestFont.getGlyph("A")
+    layerGlyph = glyph.layers["MutatorSansLightCondensed/foreground"].glyph
+    assert layerGlyph.xAdvance == originalXAdvance
+    assert "test" not in glyph.customData
+
+    layerGlyph.xAdvance = originalXAdvance + 100
+    await writableTestFont.putGlyph("A", glyph, [ord("A")])
+    glyph = await writableTestFont.getGlyph("A")
+    layerGlyph = glyph.layers["MutatorSansLightCondensed/foreground"].glyph
+    assert layerGlyph.xAdvance == originalXAdvance + 100
+
+
+async def test_putGlyphKeepsUnknownUFOGlyphData(writableTestFont):
+    glyphSet = writableTestFont.defaultUFOLayer.glyphSet
+    ufoGlyph = readGlyphOrCreate(glyphSet, "A", [ord("A")])
+    ufoGlyph.lib["com.example.test"] = 123
+    glyphSet.writeGlyph("A", ufoGlyph)
+
+    glyph = await writableTestFont.getGlyph("A")
+    await writableTestFont.putGlyph("A", glyph, [ord("A")])
+    ufoGlyph = readGlyphOrCreate(glyphSet, "A", [ord("A")])
+    assert ufoGlyph.lib["com.example.test"] == 123
+
+
 @pytest.mark.parametrize("glyphName", ["A"])
 async def test_roundTripGlyphSingleUFO(writableTestFontSingleUFO, glyphName):
     existingData = readGLIFData(glyphName, writableTestFontSingleUFO.ufoLayers)
@@ -452,6 +488,18 @@ async def test_deleteGlyph(writableTestFont):
     assert await writableTestFont.getGlyph(glyphName) is None
 
 
+async def test_batchedWrites(writableTestFont):
+    glyphSet = writableTestFont.defaultUFOLayer.glyphSet
+    glyph = await writableTestFont.getGlyph("A")
+    with writableTestFont.batchedWrites():
+        await writableTestFont.putGlyph("A.alt1", glyph, [])
+        await writableTestFont.putGlyph("A.alt2", glyph, [])
+        assert "A.alt1" not in glyphSet.fs.readtext("contents.plist")
+    contentsText = glyphSet.fs.readtext("contents.plist")
+    assert "A.alt1" in contentsText
+    assert "A.alt2" in contentsText
+
+
 async def test_deleteGlyphRaisesKeyError(writableTestFont):
     glyphName = "A.doesnotexist"
     with pytest.raises(KeyError, match="Glyph 'A.doesnotexist' does not exist"):
@@ -687,6 +735,19 @@ async def test_getFeatures(testFont):
     assert "# Included feature text" in features.text
 
 
+@pytest.mark.parametrize(
+    "existingNames, names, expectedNames",
+    [
+        ([], ["a", "b", "a", "a", "b"], ["a", "b", "a#1", "a#2", "b#1"]),
+        (["a", "a#2"], ["a", "a", "a"], ["a#1", "a#3", "a#4"]),
+        (["a"], ["a#1", "a", "a"], ["a#1", "a#2", "a#3"]),
+    ],
+)
+def test_uniqueNameMaker(existingNames, names, expectedNames):
+    makeUniqueName = uniqueNameMaker(existingNames)
+    assert [makeUniqueName(name) for name in names] == expectedNames
+
+
 def fileNamesFromDir(path):
     return sorted(p.name for p in path.iterdir())
 
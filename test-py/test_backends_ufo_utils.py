@@ -0,0 +1,67 @@
+import pytest
+
+from fontra.backends.ufo_utils import (
+    extractGlyphNameAndCodePoints,
+    extractGlyphNameAndCodePointsFromPath,
+    readGlifHeader,
+)
+
+
+@pytest.mark.parametrize(
+    "glifData,expectedResult",
+    [
+        (
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<glyph name="A" format="2">\n'
+            b'  <advance width="500"/>\n'
+            b'  <unicode hex="0041"/>\n'
+            b'  <unicode hex="0061"/>\n'
+            b"  <outline>\n"
+            b'    <component base="B"/>\n'
+            b"  </outline>\n"
+            b"</glyph>\n",
+            ("A", [0x41, 0x61]),
+        ),
+        (
+            b'<glyph name="a&amp;b" format="2"><outline/></glyph>',
+            ("a&b", []),
+        ),
+        (
+            b'<glyph format="2" name="A"><unicode hex="0041"/></glyph>',
+            ("A", [0x41]),
+        ),
+        (
+            # not well-formed XML, but the header can be scanned
+            b'<glyph name="A" format="2"><unicode hex="0041"><outline></glyph>',
+            ("A", [0x41]),
+        ),
+    ],
+)
+def test_extractGlyphNameAndCodePoints(glifData, expectedResult):
+    assert extractGlyphNameAndCodePoints(glifData) == expectedResult
+
+
+def test_extractGlyphNameAndCodePoints_noGlyphName():
+    with pytest.raises(ValueError, match="glyph name not found"):
+        extractGlyphNameAndCodePoints(b"<glif/>", "A_.glif")
+
+
+def test_extractGlyphNameAndCodePointsFromPath(tmp_path):
+    glifPath = tmp_path / "A_.glif"
+    glifPath.write_bytes(b'<glyph name="A" format="2"><unicode hex="0041"/></glyph>')
+    assert extractGlyphNameAndCodePointsFromPath(glifPath) == ("A", [0x41])
+
+    emptyPath = tmp_path / "empty.glif"
+    emptyPath.write_bytes(b"")
+    with pytest.raises(ValueError, match="glyph name not found"):
+        extractGlyphNameAndCodePointsFromPath(emptyPath)
+
+
+@pytest.mark.parametrize("chunkSize", [1, 7, 4096])
+def test_readGlifHeader(tmp_path, chunkSize):
+    glifPath = tmp_path / "A_.glif"
+    header = b'<glyph name="A" format="2">\n  <unicode hex="0041"/>\n  <outline>'
+    glifPath.write_bytes(header + b'\n    <component base="B"/>\n  </outline>\n')
+    data = readGlifHeader(glifPath, chunkSize)
+    assert data.startswith(header)
+    assert extractGlyphNameAndCodePoints(data) == ("A", [0x41])
@@ -7,7 +7,11 @@ from contextlib import aclosing
 import pytest
 
 from fontra.backends.designspace import DesignspaceBackend
-from fontra.core.fonthandler import FontHandler
+from fontra.core.fonthandler import (
+    DictSetDelTracker,
+    FontHandler,
+    makeGlyphMapChange,
+)
 
 mutatorSansDir = pathlib.Path(__file__).resolve().parent / "data" / "mutatorsans"
 
@@ -281,5 +285,44 @@ async def test_fontHandler_new_glyph(testFontHandler):
         assert glifPath.exists()
 
 
+def test_dictSetDelTracker():
+    data = {"A": 1, "B": 2}
+    tracker = DictSetDelTracker(data)
+    tracker["C"] = 3
+    tracker["A"] = 10
+    del tracker["B"]
+    del tracker["C"]
+    tracker["B"] = 20
+    assert data == {"A": 10, "B": 20}
+    assert tracker.newKeys == {"B"}
+    assert tracker.deletedKeys == {"C"}
+    assert sorted(tracker.keys()) == ["A", "B"]
+    assert "B" in tracker and "C" not in tracker
+
+
 def firstLayerItem(glyph):
     return next(iter(glyph.layers.items()))
+
+
+@pytest.mark.parametrize(
+    "glyphMapUpdates, expectedChange",
+    [
+        ({}, None),
+        ({"A": [65]}, {"p": ["glyphMap"], "f": "=", "a": ["A", [65]]}),
+        ({"A": None}, {"p": ["glyphMap"], "f": "d", "a": ["A"]}),
+        (
+            {"A": None, "B": [66], "C": None, "D": []},
+            {
+                "p": ["glyphMap"],
+                "c": [
+                    {"f": "=", "a": ["B", [66]]},
+                    {"f": "=", "a": ["D", []]},
+                    {"f": "d", "a": ["A"]},
+                    {"f": "d", "a": ["C"]},
+                ],
+            },
+        ),
+    ],
+)
+def test_makeGlyphMapChange(glyphMapUpdates, expectedChange):
+    assert makeGlyphMapChange(glyphMapUpdates) == expectedChange
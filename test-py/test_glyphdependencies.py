@@ -26,6 +26,14 @@ from fontra.core.glyphdependencies import GlyphDependencies
             {},
             {},
         ),
+        (
+            [
+                ("Adieresis", ["A", "dieresis"]),
+                ("Adieresis", ["dieresis", "A", "A"]),
+            ],
+            {"A": {"Adieresis"}, "dieresis": {"Adieresis"}},
+            {"Adieresis": {"A", "dieresis"}},
+        ),
     ],
 )
 def test_glyphdependencies(updates, expectedUsedBy, expectedMadeOf):
@@ -34,3 +42,14 @@ def test_glyphdependencies(updates, expectedUsedBy, expectedMadeOf):
         deps.update(glyphName, componentNames)
     assert expectedUsedBy == deps.usedBy
     assert expectedMadeOf == deps.madeOf
+
+
+def test_glyphdependencies_unchangedComponents():
+    deps = GlyphDependencies()
+    deps.update("Adieresis", ["A", "dieresis"])
+    usedByA = deps.usedBy["A"]
+    deps.update("Adieresis", ["A", "dieresis"])
+    deps.update("Adieresis", ["A", "grave"])
+    # The used-by set of a component that is kept is updated in place
+    assert deps.usedBy["A"] is usedByA
+    assert {"A": {"Adieresis"}, "grave": {"Adieresis"}} == deps.usedBy
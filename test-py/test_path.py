@@ -135,6 +135,21 @@ def test_packedPathPointPenRoundTrip(path):
     assert unstructure(path) == unstructure(repackedPath)
 
 
+def test_drawPointsSkipsOffCurveOnlyContour():
+    path = PackedPath.fromUnpackedContours(
+        [
+            {"points": [{"x": 0, "y": 0, "type": "cubic"}], "isClosed": False},
+            {
+                "points": [{"x": 10, "y": 10}, {"x": 20, "y": 20}, {"x": 30, "y": 0}],
+                "isClosed": True,
+            },
+        ]
+    )
+    pen = PackedPathPointPen()
+    path.drawPoints(pen)
+    assert pen.getPath() == PackedPath.fromUnpackedContours(path.unpackedContours()[1:])
+
+
 @pytest.mark.parametrize("path", pathTestData)
 def test_unpackPathRoundTrip(path):
     path = structure(path, PackedPath)